@@ -0,0 +1,107 @@
+# Compact versions of the User class from main.py for holding millions of records
+import time
+import tracemalloc
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass
+
+
+# The original: every instance carries its own __dict__
+class User:
+    def __init__(self, username):
+        self.username = username
+        self._internal_value = 42  # Private variable (single underscore)
+        self.__secure_data = "Hidden"  # Strongly private variable (double underscores)
+
+
+# __slots__: fixed attribute slots instead of a __dict__ per instance.
+# Name mangling still works, `__secure_data` becomes `_SlotsUser__secure_data`.
+class SlotsUser:
+    __slots__ = ('username', '_internal_value', '__secure_data')
+
+    def __init__(self, username):
+        self.username = username
+        self._internal_value = 42
+        self.__secure_data = "Hidden"
+
+
+# namedtuple and dataclass fields can't be (or shouldn't be) "private",
+# so these use plain names for the same data.
+TupleUser = namedtuple('TupleUser', ['username', 'internal_value', 'secure_data'])
+
+
+@dataclass(slots=True)
+class DataclassUser:
+    username: str
+    internal_value: int = 42
+    secure_data: str = "Hidden"
+
+
+class UserTable:
+    """Struct of arrays: one column per attribute instead of one object per user.
+
+    Numbers are packed into an array.array (8 bytes each), so a million
+    users cost three list/array entries each rather than a million objects.
+    """
+
+    def __init__(self):
+        self.usernames = []
+        self.internal_values = array('q')
+        self.secure_data = []
+
+    def append(self, username, internal_value=42, secure_data="Hidden"):
+        self.usernames.append(username)
+        self.internal_values.append(internal_value)
+        self.secure_data.append(secure_data)
+
+    def __len__(self):
+        return len(self.usernames)
+
+    def __getitem__(self, index):
+        """Rebuilds one user as a TupleUser, only when it is asked for."""
+        return TupleUser(self.usernames[index], self.internal_values[index], self.secure_data[index])
+
+
+def _build(kind, usernames):
+    if kind is TupleUser:
+        return [TupleUser(name, 42, "Hidden") for name in usernames]
+    if kind is UserTable:
+        table = UserTable()
+        for name in usernames:
+            table.append(name)
+        return table
+    return [kind(name) for name in usernames]
+
+
+def _read_all(kind, records):
+    """Sums internal_value over all records, the way each type is normally read."""
+    if kind is UserTable:
+        return sum(records.internal_values)
+    if kind in (User, SlotsUser):
+        return sum(record._internal_value for record in records)
+    return sum(record.internal_value for record in records)
+
+
+def benchmark(count=1_000_000):
+    # The usernames are shared by every variant, so only the records are measured
+    usernames = [f"user{i}" for i in range(count)]
+    print(f"{count:,} records")
+    print(f"{'type':<16} {'memory (MB)':>12} {'bytes/record':>13} {'read (s)':>9}")
+    for kind in (User, SlotsUser, TupleUser, DataclassUser, UserTable):
+        tracemalloc.start()
+        records = _build(kind, usernames)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        _read_all(kind, records)
+        read_time = time.perf_counter() - start
+        print(f"{kind.__name__:<16} {memory / 1e6:>12.1f} {memory / count:>13.1f} {read_time:>9.3f}")
+        del records
+
+
+if __name__ == "__main__":
+    user1 = SlotsUser("admin")
+    print(user1._internal_value, user1._SlotsUser__secure_data)  # 42 Hidden
+    # user1.nickname = "boss"  # AttributeError: there is no slot (and no __dict__) for it
+    benchmark()
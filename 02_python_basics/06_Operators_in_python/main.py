@@ -64,11 +64,11 @@ print("banana" in fruits)  # True (exists in the list)
 print("grape" not in fruits)  # True (does not exist)
 
 # Using @ Operator (Matrix Multiplication)
-import numpy as np
+from matrix import Matrix  # uses NumPy when installed, pure Python otherwise
 
-matrix1 = np.array([[1, 2], [3, 4]])
-matrix2 = np.array([[5, 6], [7, 8]])
+matrix1 = Matrix([[1, 2], [3, 4]])
+matrix2 = Matrix([[5, 6], [7, 8]])
 
 result = matrix1 @ matrix2  # Matrix multiplication
-print(result)  # Output: [[19 22]
-              #          [43 50]]
+print(result)  # Output: 19 22
+              #         43 50
@@ -0,0 +1,122 @@
+# A small Matrix type that supports the @ operator with or without NumPy
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+BLOCK_SIZE = 64           # rows/columns per tile in the pure-Python kernel
+PARALLEL_THRESHOLD = 256  # use several processes from this many rows up
+
+
+def _multiply_rows(a_rows, b_rows, block=BLOCK_SIZE):
+    """Blocked (tiled) multiplication of some rows of A by all of B.
+
+    Working tile by tile keeps the pieces of B being reused small, and each
+    tile is sliced out of B only once instead of once per row of A.
+    """
+    inner, columns = len(b_rows), len(b_rows[0]) if b_rows else 0
+    result = [[0] * columns for _ in a_rows]
+    for k0 in range(0, inner, block):
+        k1 = min(k0 + block, inner)
+        for j0 in range(0, columns, block):
+            j1 = min(j0 + block, columns)
+            tile = [(k, b_rows[k][j0:j1]) for k in range(k0, k1)]
+            for a_row, c_row in zip(a_rows, result):
+                c_part = c_row[j0:j1]
+                for k, b_part in tile:
+                    a_value = a_row[k]
+                    if a_value:
+                        c_part = [c + a_value * b for c, b in zip(c_part, b_part)]
+                c_row[j0:j1] = c_part
+    return result
+
+
+_worker_b_rows = None
+
+
+def _init_worker(b_rows):
+    """Sends B to each worker process once, not once per task."""
+    global _worker_b_rows
+    _worker_b_rows = b_rows
+
+
+def _multiply_chunk(a_rows):
+    return _multiply_rows(a_rows, _worker_b_rows)
+
+
+def _multiply_parallel(a_rows, b_rows, workers=None):
+    """Splits the rows of A between processes and joins their results."""
+    workers = workers or os.cpu_count() or 1
+    chunk = -(-len(a_rows) // workers)  # ceiling division
+    chunks = [a_rows[i:i + chunk] for i in range(0, len(a_rows), chunk)]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(b_rows,)) as executor:
+        return [row for part in executor.map(_multiply_chunk, chunks) for row in part]
+
+
+class Matrix:
+    """A matrix stored as a list of rows, e.g. Matrix([[1, 2], [3, 4]])."""
+
+    def __init__(self, rows):
+        self.rows = [list(row) for row in rows]
+
+    @property
+    def shape(self):
+        return len(self.rows), len(self.rows[0]) if self.rows else 0
+
+    def __matmul__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Cannot multiply {self.shape} by {other.shape} matrices")
+        if np is not None:
+            return Matrix((np.array(self.rows) @ np.array(other.rows)).tolist())
+        if len(self.rows) >= PARALLEL_THRESHOLD:
+            return Matrix(_multiply_parallel(self.rows, other.rows))
+        return Matrix(_multiply_rows(self.rows, other.rows))
+
+    def __eq__(self, other):
+        return isinstance(other, Matrix) and self.rows == other.rows
+
+    def __repr__(self):
+        return f"Matrix({self.rows})"
+
+    def __str__(self):
+        return "\n".join(" ".join(str(value) for value in row) for row in self.rows)
+
+
+def benchmark(sizes=(64, 256, 1024), serial_limit=256):
+    """Times each multiplication path on random n x n matrices.
+
+    The serial pure-Python kernel is skipped above `serial_limit`, since at
+    1024 it needs about a billion Python-level multiplications.
+    """
+    print(f"{'size':>6} {'blocked':>10} {'parallel':>10} {'numpy':>10}")
+    for n in sizes:
+        a = [[random.random() for _ in range(n)] for _ in range(n)]
+        b = [[random.random() for _ in range(n)] for _ in range(n)]
+        timings = []
+        for name in ('blocked', 'parallel', 'numpy'):
+            if (name == 'blocked' and n > serial_limit) or (name == 'numpy' and np is None):
+                timings.append("skipped")
+                continue
+            start = time.perf_counter()
+            if name == 'blocked':
+                _multiply_rows(a, b)
+            elif name == 'parallel':
+                _multiply_parallel(a, b)
+            else:
+                np.array(a) @ np.array(b)
+            timings.append(f"{time.perf_counter() - start:.3f} s")
+        print(f"{n:>6} " + " ".join(f"{timing:>10}" for timing in timings))
+
+
+if __name__ == "__main__":
+    matrix1 = Matrix([[1, 2], [3, 4]])
+    matrix2 = Matrix([[5, 6], [7, 8]])
+    print(matrix1 @ matrix2)  # 19 22 / 43 50
+    benchmark()
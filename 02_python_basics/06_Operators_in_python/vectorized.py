@@ -0,0 +1,137 @@
+# Applying the operators from main.py to whole arrays at once
+import operator
+import sys
+import time
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the array module is always there
+    np = None
+
+# Arithmetic Operators
+ARITHMETIC = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '**': operator.pow,
+    '//': operator.floordiv,
+}
+
+# Comparison Operators
+COMPARISON = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# Bitwise Operators (whole numbers only)
+BITWISE = {
+    '&': operator.and_,
+    '|': operator.or_,
+    '^': operator.xor,
+    '<<': operator.lshift,
+    '>>': operator.rshift,
+}
+
+OPERATORS = {**ARITHMETIC, **COMPARISON, **BITWISE}
+
+
+def to_array(values):
+    """Packs numbers into a NumPy array, or an array.array without NumPy."""
+    if np is not None:
+        return np.asarray(values)
+    if isinstance(values, array):
+        return values
+    values = list(values)
+    if all(isinstance(value, int) for value in values):
+        return array('q', values)  # 64-bit ints
+    return array('d', values)      # 64-bit floats
+
+
+def _is_whole(values):
+    return isinstance(values, int) or (isinstance(values, array) and values.typecode in 'bBhHiIlLqQ')
+
+
+def _has_negative(values):
+    if np is not None:
+        # np.min runs in C, and also takes NumPy scalars such as np.int64(-1)
+        return np.size(values) > 0 and bool(np.min(values) < 0)
+    if isinstance(values, (int, float)):
+        return values < 0
+    return len(values) > 0 and min(values) < 0
+
+
+def apply(symbol, a, b):
+    """Applies a binary operator element by element, e.g. apply('+', a, b).
+
+    `b` may be an array of the same length or a single number.
+    """
+    function = OPERATORS[symbol]
+    # 2 ** -1 is 0.5, so a power with a negative exponent gives floats
+    negative_power = symbol == '**' and _has_negative(b)
+    if np is not None:
+        a = to_array(a)
+        if negative_power:
+            a = a.astype(np.float64)  # NumPy refuses negative powers of integers
+        return function(a, b if isinstance(b, (int, float)) else to_array(b))
+
+    a = to_array(a)
+    if not isinstance(b, (int, float)):
+        b = to_array(b)
+    results = map(function, a, repeat(b) if isinstance(b, (int, float)) else b)
+    if symbol in COMPARISON:
+        return array('b', results)  # 1 for True, 0 for False
+    if symbol != '/' and not negative_power and _is_whole(a) and _is_whole(b):
+        return array('q', results)
+    return array('d', results)
+
+
+def invert(a):
+    """Bitwise NOT (~) of every element."""
+    if np is not None:
+        return ~to_array(a)
+    return array('q', map(operator.invert, to_array(a)))
+
+
+def benchmark(size=1_000_000):
+    """Compares a per-element Python loop with apply() for a few operators."""
+    a = list(range(1, size + 1))
+    b = list(range(size, 0, -1))
+    packed_a, packed_b = to_array(a), to_array(b)
+    engine = "NumPy" if np is not None else "array module"
+
+    print(f"{size:,} elements, vectorized path uses the {engine}")
+    # Without NumPy the speed stays close to the loop; the gain is memory
+    list_bytes = sys.getsizeof(a) + sum(sys.getsizeof(value) for value in a)
+    packed_bytes = packed_a.nbytes if np is not None else sys.getsizeof(packed_a)
+    print(f"memory: list {list_bytes / 1e6:.1f} MB   packed {packed_bytes / 1e6:.1f} MB")
+    for symbol in ('+', '*', '//', '<', '&', '<<'):
+        function = OPERATORS[symbol]
+        start = time.perf_counter()
+        looped = []
+        for i in range(size):
+            looped.append(function(a[i], b[i] if symbol != '<<' else 3))
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        apply(symbol, packed_a, packed_b if symbol != '<<' else 3)
+        vector_time = time.perf_counter() - start
+        print(f"{symbol:>3}  loop {loop_time:.3f} s   vectorized {vector_time:.3f} s   "
+              f"({loop_time / vector_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    print(list(apply('+', [10, 20], [3, 4])))   # [13, 24]
+    print(list(apply('/', [10, 20], 4)))        # [2.5, 5.0]
+    print(list(apply('**', [2, 3], -1)))        # [0.5, 0.3333333333333333]
+    print(list(apply('>=', [5, 1], [3, 3])))    # [1, 0] (True, False)
+    print(list(apply('^', [5, 6], [3, 3])))     # [6, 5]
+    print(list(invert([5, 0])))                 # [-6, -1]
+    benchmark()
@@ -0,0 +1,109 @@
+# Watching what binding, rebinding and del do to objects in memory
+import contextlib
+import gc
+import sys
+import tracemalloc
+import weakref
+from collections import Counter
+
+
+def ref_count(obj):
+    """How many references point to obj (minus the one made by this call)."""
+    return sys.getrefcount(obj) - 2
+
+
+class RefTracker:
+    """Tracks object lifetimes and finds objects that are never freed.
+
+    `track()` watches single objects: weakref.finalize calls back when an
+    object is freed, without keeping it alive itself. `watch()` compares
+    object counts and traced memory before and after a block of code,
+    which is a cheap way to spot leaks in a long-running service.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.alive = {}
+
+    def track(self, obj, label):
+        """Starts watching obj. Plain dicts, lists, ints and strs can't be
+        watched this way (they don't support weak references), but
+        subclasses of dict and list, and ordinary class instances, can."""
+        self.alive[label] = sys.getsizeof(obj)
+        weakref.finalize(obj, self._freed, label)
+        self.events.append(f"{label}: created, {ref_count(obj) - 1} reference(s)")
+
+    def _freed(self, label):
+        size = self.alive.pop(label, 0)
+        self.events.append(f"{label}: freed ({size} bytes)")
+
+    def note(self, label, obj):
+        """Records the current number of references to obj."""
+        self.events.append(f"{label}: {ref_count(obj) - 1} reference(s)")
+
+    @staticmethod
+    def snapshot():
+        """Counts live objects per type and reads the traced memory."""
+        gc.collect()
+        counts = Counter(type(obj).__name__ for obj in gc.get_objects())
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        return counts, memory
+
+    @contextlib.contextmanager
+    def watch(self, label, min_growth=50):
+        """Reports which object types grew by at least min_growth, and the memory kept, inside the block."""
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        counts_before, memory_before = self.snapshot()
+        # Read after the first snapshot and before the last, so their own gc.collect() isn't counted
+        collections_before = sum(stats['collections'] for stats in gc.get_stats())
+        try:
+            yield
+        finally:
+            collections = sum(stats['collections'] for stats in gc.get_stats()) - collections_before
+            counts_after, memory_after = self.snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            grown = {name: counts_after[name] - counts_before[name]
+                     for name in counts_after
+                     if counts_after[name] - counts_before[name] >= min_growth}
+            self.events.append(
+                f"{label}: {memory_after - memory_before:+,} bytes retained, "
+                f"{collections} gc run(s), new objects: {grown or 'none'}"
+            )
+
+    def report(self):
+        for event in self.events:
+            print(event)
+        if self.alive:
+            print("Still alive:", ", ".join(self.alive))
+
+
+class Settings(dict):
+    """A dict subclass, so it can be watched with a weak reference."""
+
+
+if __name__ == "__main__":
+    tracker = RefTracker()
+
+    # Binding and unbinding, as in main.py
+    c = Settings(x=1, y=2)        # 'c' refers to a dictionary object
+    tracker.track(c, "settings")
+    d = c                         # 'd' is another reference to the same dictionary
+    tracker.note("after d = c", c)
+    del c                         # the dictionary persists via 'd'
+    tracker.note("after del c", d)
+    d = {"x": 1}                  # rebinding 'd' drops the last reference: freed now
+
+    # A leak: every call leaves an object behind in a global list
+    cache = []
+
+    def handle_request(number):
+        cache.append(Settings(request=number))
+
+    with tracker.watch("1000 requests"):
+        for number in range(1000):
+            handle_request(number)
+
+    tracker.report()
@@ -0,0 +1,143 @@
+# Converting whole columns of strings at once instead of one int()/float() call at a time
+import math
+import sys
+import time
+from array import array
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# What each type is stored as, and the value used for rows that fail to convert
+COLUMN_TYPES = {
+    int: ('q', 0),           # 64-bit integers
+    float: ('d', math.nan),  # 64-bit floats
+}
+
+
+def infer_type(values, sample_size=1000, max_bad=0.1):
+    """Guesses int, float or str by trying to convert the first few values.
+
+    A type is still picked if up to `max_bad` of the sample fails, so a few
+    bad rows turn into errors instead of making the whole column text. A
+    value like '2.5' is never a bad int: it makes the column float.
+    """
+    sample = [value for value in islice(values, sample_size) if value.strip()]
+    bad = 0
+    for value in sample:
+        try:
+            int(value)
+        except ValueError:
+            if _is_float(value):
+                return _infer_float(sample, max_bad)
+            bad += 1
+    if bad <= max_bad * len(sample):
+        return int
+    return _infer_float(sample, max_bad)
+
+
+def _is_float(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _infer_float(sample, max_bad):
+    bad = sum(1 for value in sample if not _is_float(value))
+    return float if bad <= max_bad * len(sample) else str
+
+
+def convert_column(values, kind=None, as_numpy=False):
+    """Converts an iterable of strings to one typed array.
+
+    Returns (column, errors). Instead of raising on a bad value, its row
+    number and text are added to `errors` and a placeholder (0 or nan) is
+    stored, so one bad row doesn't stop the whole column. An int too big
+    for 64 bits is an error too, rather than a silently rounded float.
+    """
+    values = values if isinstance(values, list) else list(values)  # read more than once below
+    inferred = kind is None
+    kind = kind or infer_type(values)
+    if kind is str:
+        return list(values), []
+
+    typecode, placeholder = COLUMN_TYPES[kind]
+    if as_numpy and np is not None:
+        try:
+            # NumPy parses the whole column in C
+            return np.array(values).astype(np.int64 if kind is int else np.float64), []
+        except (ValueError, OverflowError):
+            pass  # some value is bad, find it with the row-by-row path below
+
+    errors = []
+    try:
+        # Fast path: map() runs the conversion loop in C
+        column = array(typecode, map(kind, values))
+    except (ValueError, OverflowError):
+        # Slow path, only when some value is bad: convert row by row
+        column = array(typecode)
+        for row, value in enumerate(values):
+            try:
+                number = kind(value)
+            except ValueError:
+                if inferred and kind is int and _is_float(value):
+                    # A float past the inferred sample: the column is float after all
+                    return convert_column(values, float, as_numpy)
+                errors.append((row, value))
+                column.append(placeholder)
+                continue
+            try:
+                column.append(number)
+            except OverflowError:  # a valid int that doesn't fit in 64 bits
+                errors.append((row, value))
+                column.append(placeholder)
+
+    if as_numpy and np is not None:
+        column = np.frombuffer(column, dtype=np.int64 if typecode == 'q' else np.float64)
+    return column, errors
+
+
+def convert_table(columns, as_numpy=False):
+    """Converts {name: [strings]} to {name: (column, errors)}, inferring each type."""
+    return {name: convert_column(values, as_numpy=as_numpy) for name, values in columns.items()}
+
+
+def benchmark(size=1_000_000):
+    """Compares converting one value at a time with convert_column()."""
+    ints = [str(i) for i in range(size)]
+    floats = [f"{i}.5" for i in range(size)]
+
+    for name, values, kind in (("int", ints, int), ("float", floats, float)):
+        # The pattern from main.py, with try/except so bad rows don't stop it
+        start = time.perf_counter()
+        converted, errors = [], []
+        for row, value in enumerate(values):
+            try:
+                converted.append(kind(value))
+            except ValueError:
+                errors.append((row, value))
+        per_call = time.perf_counter() - start
+        list_bytes = sys.getsizeof(converted) + sum(sys.getsizeof(value) for value in converted)
+
+        start = time.perf_counter()
+        column, errors = convert_column(values, kind, as_numpy=True)
+        bulk = time.perf_counter() - start
+        column_bytes = column.nbytes if np is not None else sys.getsizeof(column)
+
+        print(f"{name:>5}: per call {size / per_call:>12,.0f} values/s {list_bytes / 1e6:>6.1f} MB   "
+              f"bulk {size / bulk:>12,.0f} values/s {column_bytes / 1e6:>6.1f} MB")
+
+
+if __name__ == "__main__":
+    table = {
+        "age": ["21", "35", "19", "48", "x", "27", "52", "33", "40", "29", "61"],
+        "price": ["9.99", "10", "12.5", "7", "", "3.25", "8", "15", "2.5", "11", "6"],
+        "name": ["Hashim", "Ali", "Sara", "Zain", "Omar", "Aisha", "Bilal", "Hina", "Usman", "Noor", "Fatima"],
+    }
+    for name, (column, errors) in convert_table(table).items():
+        print(name, column, "errors:", errors)
+    benchmark()
@@ -0,0 +1,74 @@
+# Batch mode for the square calculator, multiplication table and pyramid loops
+#
+# Instead of one input() and many print() calls per request, every request
+# is read from a file (or stdin) and all results go through one big buffer:
+#
+#   square 12
+#   table 5
+#   pyramid 4
+#
+# Usage: python batch_mode.py [requests.txt] [output.txt]
+import sys
+import time
+
+from renderer import CachedRenderer
+
+renderer = CachedRenderer()
+
+
+def square_lines(number):
+    yield f"The square of {number} is {number ** 2}\n"
+
+
+def table_lines(table_number):
+    yield f"Multiplication Table for {table_number}\n"
+    yield renderer.table(table_number)
+
+
+def pyramid_lines(height):
+    yield f"Pyramid of height {height}\n"
+    yield from renderer.pyramid_lines(height)
+
+
+COMMANDS = {
+    'square': square_lines,
+    'table': table_lines,
+    'pyramid': pyramid_lines,
+}
+
+
+def run_requests(lines):
+    """Turns request lines into output lines, one request at a time."""
+    for line_number, line in enumerate(lines, start=1):
+        parts = line.split()
+        if not parts:
+            continue
+        try:
+            command, value = parts
+            yield from COMMANDS[command.lower()](int(value))
+        except (ValueError, KeyError):
+            yield f"Line {line_number}: can't understand {line.strip()!r}\n"
+
+
+def run_batch(input_file, output_file):
+    """Reads all requests from input_file and writes every result to output_file."""
+    output_file.writelines(run_requests(input_file))
+    output_file.flush()
+
+
+def main():
+    # A 1 MB buffer turns millions of small writes into a few large ones
+    input_file = open(sys.argv[1]) if len(sys.argv) > 1 else sys.stdin
+    if len(sys.argv) > 2:
+        output_file = open(sys.argv[2], 'w', buffering=1024 * 1024)
+    else:
+        output_file = open(sys.stdout.fileno(), 'w', buffering=1024 * 1024, closefd=False)
+
+    start = time.perf_counter()
+    with input_file, output_file:
+        run_batch(input_file, output_file)
+    print(f"Finished in {time.perf_counter() - start:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Cached renderer for the multiplication-table and pyramid loops
+from collections import OrderedDict
+
+
+class CachedRenderer:
+    """Renders tables and pyramids once and reuses the finished strings.
+
+    Results live in an LRU (least recently used) cache. When the cached text
+    grows past `max_chars`, the entries used longest ago are dropped first.
+    """
+
+    def __init__(self, max_chars=16 * 1024 * 1024):
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._cached_chars = 0
+
+    def _lookup(self, key, build):
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self.misses += 1
+        text = build()
+        if len(text) <= self.max_chars:
+            self._cache[key] = text
+            self._cached_chars += len(text)
+            while self._cached_chars > self.max_chars:
+                _, old_text = self._cache.popitem(last=False)
+                self._cached_chars -= len(old_text)
+        return text
+
+    def table(self, table_number, start=1, stop=10):
+        """The lines 'n x i = n*i' for i from start to stop, as one string."""
+        return self._lookup(
+            ('table', table_number, start, stop),
+            lambda: "".join([f"{table_number} x {i} = {table_number * i}\n"
+                             for i in range(start, stop + 1)]),
+        )
+
+    @staticmethod
+    def _pyramid_rows(height):
+        for i in range(1, height + 1):
+            yield " " * (height - i) + "*" * (2 * i - 1) + "\n"
+
+    @staticmethod
+    def pyramid_size(height):
+        """Characters in pyramid(height): row i is height + i - 1 wide, plus a newline."""
+        return height * height + height * (height + 1) // 2
+
+    def pyramid(self, height):
+        """A centered pyramid of stars, as one string."""
+        return self._lookup(('pyramid', height), lambda: "".join(self._pyramid_rows(height)))
+
+    def pyramid_lines(self, height):
+        """Yields the pyramid as one cached string if it fits in max_chars.
+
+        A bigger pyramid is yielded row by row and never held in memory.
+        """
+        if self.pyramid_size(height) > self.max_chars:
+            yield from self._pyramid_rows(height)
+        else:
+            yield self.pyramid(height)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._cache),
+            'cached_chars': self._cached_chars,
+        }
+
+
+if __name__ == "__main__":
+    renderer = CachedRenderer(max_chars=200)
+    print(renderer.table(5), end='')
+    for height in (3, 4, 4, 3):
+        print(renderer.pyramid(height))
+    rows = renderer.pyramid_lines(20)  # 610 characters: streamed, not cached
+    print(next(rows), end='')
+    print(renderer.stats())
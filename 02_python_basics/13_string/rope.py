@@ -0,0 +1,240 @@
+# A rope: a string built from many chunks without copying them into one big string
+import random
+import time
+
+LEAF_SIZE = 1024  # small pieces are packed into leaves of about this many characters
+
+
+class _Node:
+    """An inner node: the text of `left` followed by the text of `right`."""
+
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.length = _length(left) + _length(right)
+        self.height = max(_height(left), _height(right)) + 1
+
+
+# Leaves are plain str objects
+def _length(node):
+    return len(node) if isinstance(node, str) else node.length
+
+
+def _height(node):
+    return 0 if isinstance(node, str) else node.height
+
+
+def _balance(left, right):
+    """Joins two subtrees whose heights differ by at most 2, rotating like an AVL tree."""
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) >= _height(left.right):
+            return _Node(left.left, _Node(left.right, right))
+        return _Node(_Node(left.left, left.right.left), _Node(left.right.right, right))
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) >= _height(right.left):
+            return _Node(_Node(left, right.left), right.right)
+        return _Node(_Node(left, right.left.left), _Node(right.left.right, right.right))
+    return _Node(left, right)
+
+
+def _join(left, right):
+    """Concatenates two ropes in O(log n), keeping the tree balanced."""
+    if not _length(left):
+        return right
+    if not _length(right):
+        return left
+    if isinstance(left, str) and isinstance(right, str) and len(left) + len(right) <= LEAF_SIZE:
+        return left + right
+    if _height(left) > _height(right) + 1:
+        return _balance(left.left, _join(left.right, right))
+    if _height(right) > _height(left) + 1:
+        return _balance(_join(left, right.left), right.right)
+    return _Node(left, right)
+
+
+def _split(node, index):
+    """Splits a rope into the text before `index` and the text from `index` on."""
+    if isinstance(node, str):
+        return node[:index], node[index:]
+    if index <= 0:
+        return "", node
+    if index >= node.length:
+        return node, ""
+    left_length = _length(node.left)
+    if index <= left_length:
+        before, after = _split(node.left, index)
+        return before, _join(after, node.right)
+    before, after = _split(node.right, index - left_length)
+    return _join(node.left, before), after
+
+
+def _leaves(node):
+    """Yields the chunks from left to right."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if node:
+                yield node
+        else:
+            stack.append(node.right)
+            stack.append(node.left)
+
+
+class Rope:
+    """A mutable string for building large texts out of many pieces.
+
+    Appending is O(1): pieces wait in a small tail list and are packed into
+    the balanced tree in leaf-sized chunks. Inserting and slicing split and
+    join the tree in O(log n). The full string is only built by str(rope).
+    """
+
+    def __init__(self, text=""):
+        self._root = ""
+        self._tail = []
+        self._tail_length = 0
+        self._text = None  # cached str(self)
+        self.append(text)
+
+    def _flush(self):
+        if self._tail:
+            self._root = _join(self._root, "".join(self._tail))
+            self._tail = []
+            self._tail_length = 0
+
+    def append(self, text):
+        if text:
+            self._tail.append(text)
+            self._tail_length += len(text)
+            self._text = None
+            if self._tail_length >= LEAF_SIZE:
+                self._flush()
+        return self
+
+    __iadd__ = append
+
+    def insert(self, index, text):
+        """Inserts text before position `index`, like list.insert."""
+        self._flush()
+        if index < 0:
+            index = max(len(self) + index, 0)
+        before, after = _split(self._root, index)
+        self._root = _join(_join(before, text), after)
+        self._text = None
+
+    def __len__(self):
+        return _length(self._root) + self._tail_length
+
+    def __getitem__(self, key):
+        self._flush()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return str(self)[key]
+            stop = max(stop, start)  # e.g. rope[5:2] is empty, like str
+            _, rest = _split(self._root, start)
+            piece, _ = _split(rest, stop - start)
+            return "".join(_leaves(piece)) if not isinstance(piece, str) else piece
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("rope index out of range")
+        node = self._root
+        while not isinstance(node, str):
+            left_length = _length(node.left)
+            if key < left_length:
+                node = node.left
+            else:
+                key -= left_length
+                node = node.right
+        return node[key]
+
+    def find(self, sub, start=0):
+        """Like str.find, but searches chunk by chunk, including matches that cross chunks."""
+        self._flush()
+        if start < 0:
+            start = max(len(self) + start, 0)
+        if not sub:
+            return start if start <= len(self) else -1
+        _, rest = _split(self._root, start)
+        carry = ""       # the end of the previous chunks, for matches across a boundary
+        offset = start   # position of `carry` in the whole text
+        for chunk in _leaves(rest) if not isinstance(rest, str) else [rest]:
+            window = carry + chunk
+            found = window.find(sub)
+            if found != -1:
+                return offset + found
+            keep = min(len(sub) - 1, len(window))
+            offset += len(window) - keep
+            carry = window[len(window) - keep:]
+        return -1
+
+    def __str__(self):
+        if self._text is None:
+            self._flush()
+            self._text = "".join(_leaves(self._root)) if not isinstance(self._root, str) else self._root
+        return self._text
+
+    def __repr__(self):
+        return f"Rope({len(self)} characters)"
+
+
+def check_slices(text="Hello World", tries=2_000):
+    """Compares rope slices with str slices, including reversed and out-of-range bounds."""
+    rope = Rope()
+    for i in range(0, len(text), 3):
+        rope += text[i:i + 3]
+    for _ in range(tries):
+        start = random.choice([None, random.randint(-2 * len(text), 2 * len(text))])
+        stop = random.choice([None, random.randint(-2 * len(text), 2 * len(text))])
+        assert rope[start:stop] == text[start:stop], (start, stop)
+
+
+def benchmark(fragments=200_000, inserts=2_000):
+    pieces = [f"line {i}, " for i in range(fragments)]
+
+    start = time.perf_counter()
+    text = ""
+    for piece in pieces:
+        text += piece                   # as in 08_Data_types_in_python: y += " World"
+    plus_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    "".join(pieces)
+    join_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rope = Rope()
+    for piece in pieces:
+        rope += piece
+    str(rope)
+    rope_time = time.perf_counter() - start
+    print(f"{fragments:,} appends:  += {plus_time:.3f} s   ''.join {join_time:.3f} s   "
+          f"Rope {rope_time:.3f} s")
+
+    # Inserting in the middle is where copying whole strings really hurts
+    positions = [random.randrange(len(text)) for _ in range(inserts)]
+    start = time.perf_counter()
+    for position in positions:
+        text = text[:position] + "X" + text[position:]
+    str_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for position in positions:
+        rope.insert(position, "X")
+    rope_time = time.perf_counter() - start
+    print(f"{inserts:,} inserts:  str {str_time:.3f} s   Rope {rope_time:.3f} s")
+    assert str(rope) == text
+
+
+if __name__ == "__main__":
+    report = Rope("Hello")
+    report += " World"
+    report.insert(5, ",")
+    print(report, report[0:5], report.find("World"))  # Hello, World Hello 7
+    print(repr(report[5:2]))                          # ''
+    check_slices()
+    check_slices("line " * 2_000)
+    benchmark()
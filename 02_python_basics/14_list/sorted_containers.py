@@ -0,0 +1,348 @@
+# Lists and dicts that stay sorted while you insert, instead of calling sort() again
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedList:
+    """A list that keeps its values in order.
+
+    Values live in many small sorted sublists ("buckets") of about
+    `load` items. Inserting only shifts values inside one bucket, and a
+    bucket is split in two when it grows past 2 * load. `_maxes` holds
+    the largest value of each bucket, so finding the right bucket is a
+    binary search. A Fenwick tree over the bucket sizes turns positions
+    into (bucket, offset) and back in O(log n), for indexing and ranks.
+    """
+
+    def __init__(self, iterable=(), load=1000):
+        self._load = load
+        values = sorted(iterable)
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [bucket[-1] for bucket in self._lists]
+        self._len = len(values)
+        self._build_index()
+
+    # --- Fenwick tree over the bucket sizes ---
+
+    def _build_index(self):
+        tree = [0] + [len(bucket) for bucket in self._lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _grow(self, bucket, delta):
+        i = bucket + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _before(self, bucket):
+        """How many values are in the buckets before `bucket`."""
+        total, i = 0, bucket
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, index):
+        """Position in the whole list -> (bucket, offset inside it)."""
+        bucket, step = 0, 1 << (len(self._tree).bit_length() - 1)
+        while step:
+            nxt = bucket + step
+            if nxt < len(self._tree) and self._tree[nxt] <= index:
+                bucket = nxt
+                index -= self._tree[nxt]
+            step >>= 1
+        return bucket, index
+
+    # --- Changing the list ---
+
+    def add(self, value):
+        """Inserts value at its sorted position."""
+        if not self._lists:
+            self._lists.append([value])
+            self._maxes.append(value)
+            self._len = 1
+            self._build_index()
+            return
+        bucket = bisect_right(self._maxes, value)
+        if bucket == len(self._maxes):
+            bucket -= 1
+            self._lists[bucket].append(value)
+            self._maxes[bucket] = value
+        else:
+            insort(self._lists[bucket], value)
+        self._len += 1
+
+        if len(self._lists[bucket]) > 2 * self._load:
+            values = self._lists[bucket]
+            self._lists[bucket:bucket + 1] = [values[:self._load], values[self._load:]]
+            self._maxes[bucket:bucket + 1] = [values[self._load - 1], values[-1]]
+            self._build_index()  # rare: only once every `load` inserts into a bucket
+        else:
+            self._grow(bucket, 1)
+
+    def remove(self, value):
+        """Removes one occurrence of value; ValueError if it isn't there."""
+        bucket = bisect_left(self._maxes, value)
+        if bucket < len(self._maxes):
+            values = self._lists[bucket]
+            offset = bisect_left(values, value)
+            if values[offset] == value:
+                self._delete(bucket, offset)
+                return
+        raise ValueError(f"{value!r} not in list")
+
+    def discard(self, value):
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def _delete(self, bucket, offset):
+        values = self._lists[bucket]
+        del values[offset]
+        self._len -= 1
+        if values:
+            self._maxes[bucket] = values[-1]
+            self._grow(bucket, -1)
+        else:
+            del self._lists[bucket]
+            del self._maxes[bucket]
+            self._build_index()
+
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty list")
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("pop index out of range")
+        bucket, offset = self._locate(index)
+        value = self._lists[bucket][offset]
+        self._delete(bucket, offset)
+        return value
+
+    # --- Reading ---
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for bucket in self._lists:
+            yield from bucket
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        bucket, offset = self._locate(index)
+        return self._lists[bucket][offset]
+
+    def bisect_left(self, value):
+        """The rank of value: how many items are smaller than it."""
+        bucket = bisect_left(self._maxes, value)
+        if bucket == len(self._maxes):
+            return self._len
+        return self._before(bucket) + bisect_left(self._lists[bucket], value)
+
+    def bisect_right(self, value):
+        """How many items are smaller than or equal to value."""
+        bucket = bisect_right(self._maxes, value)
+        if bucket == len(self._maxes):
+            return self._len
+        return self._before(bucket) + bisect_right(self._lists[bucket], value)
+
+    def __contains__(self, value):
+        bucket = bisect_left(self._maxes, value)
+        if bucket == len(self._maxes):
+            return False
+        values = self._lists[bucket]
+        return values[bisect_left(values, value)] == value
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value):
+        if value not in self:
+            raise ValueError(f"{value!r} is not in list")
+        return self.bisect_left(value)
+
+    def irange(self, minimum, maximum):
+        """Yields the values with minimum <= value <= maximum, in order."""
+        bucket = bisect_left(self._maxes, minimum)
+        if bucket == len(self._maxes):
+            return
+        offset = bisect_left(self._lists[bucket], minimum)
+        for values in self._lists[bucket:]:
+            for value in values[offset:]:
+                if value > maximum:
+                    return
+                yield value
+            offset = 0
+
+    def __repr__(self):
+        return f"SortedList({list(self)})"
+
+
+class SortedDict(dict):
+    """A dict whose keys are always iterated in sorted order.
+
+    Every dict method that adds or removes keys is overridden to keep
+    `_keys` in step; the C versions in dict would skip it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._keys = SortedList(super().keys())
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._keys.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._keys.remove(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._keys.remove(key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = self.copy()
+        result.update(other)
+        return result
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        result = SortedDict(other)
+        result.update(self)
+        return result
+
+    def copy(self):
+        return SortedDict(self)
+
+    def __reduce__(self):
+        # Pickle as SortedDict(items), so __init__ runs before any key is set
+        return SortedDict, (dict(self),)
+
+    def clear(self):
+        super().clear()
+        self._keys = SortedList()
+
+    def popitem(self):
+        """Removes and returns the item with the largest key."""
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = self._keys.pop()
+        return key, super().pop(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(list(self._keys))
+
+    def keys(self):
+        return list(self._keys)
+
+    def values(self):
+        return [self[key] for key in self._keys]
+
+    def items(self):
+        return [(key, self[key]) for key in self._keys]
+
+    def peekitem(self, index=-1):
+        """The item at a position in key order, e.g. peekitem(0) is the smallest key."""
+        key = self._keys[index]
+        return key, self[key]
+
+    def bisect_left(self, key):
+        """The rank of key: how many keys are smaller than it."""
+        return self._keys.bisect_left(key)
+
+    def bisect_right(self, key):
+        """How many keys are smaller than or equal to key."""
+        return self._keys.bisect_right(key)
+
+    def index(self, key):
+        """The position of key in sorted order; ValueError if it isn't there."""
+        return self._keys.index(key)
+
+    def irange(self, minimum, maximum):
+        """Yields the keys with minimum <= key <= maximum, in order."""
+        return self._keys.irange(minimum, maximum)
+
+    def __repr__(self):
+        return f"SortedDict({dict(self.items())})"
+
+
+def benchmark(count=20_000, big_count=200_000):
+    values = [random.random() for _ in range(big_count)]
+
+    # The pattern from the list chapter: append, then sort() again
+    start = time.perf_counter()
+    numbers = []
+    for value in values[:count]:
+        numbers.append(value)
+        numbers.sort()
+    resort_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted_numbers = SortedList()
+    for value in values[:count]:
+        sorted_numbers.add(value)
+    sorted_time = time.perf_counter() - start
+    print(f"{count:,} inserts:  append + sort() {resort_time:.3f} s   SortedList {sorted_time:.3f} s")
+
+    # With many more values, even bisect.insort into one list falls behind
+    start = time.perf_counter()
+    numbers = []
+    for value in values:
+        insort(numbers, value)
+    insort_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted_numbers = SortedList()
+    for value in values:
+        sorted_numbers.add(value)
+    sorted_time = time.perf_counter() - start
+    print(f"{big_count:,} inserts:  bisect.insort {insort_time:.3f} s   SortedList {sorted_time:.3f} s")
+
+
+if __name__ == "__main__":
+    scores = SortedList([70, 95, 60])
+    scores.add(85)
+    print(scores, scores[0], scores.bisect_left(85))  # SortedList([60, 70, 85, 95]) 60 2
+    print(list(scores.irange(65, 90)))                # [70, 85]
+
+    ages = SortedDict({"Zain": 31, "Ali": 24})
+    ages["Hashim"] = 24
+    print(list(ages), ages.peekitem(0))               # ['Ali', 'Hashim', 'Zain'] ('Ali', 24)
+    ages |= {"Bilal": 27}
+    print(list(ages), ages.bisect_left("Hina"))       # ['Ali', 'Bilal', 'Hashim', 'Zain'] 3
+    benchmark()
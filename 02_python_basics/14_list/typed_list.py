@@ -0,0 +1,173 @@
+# A list of numbers that stores raw values instead of boxed Python objects
+import sys
+import time
+import tracemalloc
+from array import array
+from collections.abc import MutableSequence
+
+
+class TypedList(MutableSequence):
+    """A list with the same methods as `list`, backed by an array.array.
+
+    Every element has one C type ('q' = 64-bit int, 'd' = 64-bit float, see
+    the array module for the others), so each value takes 8 bytes instead
+    of an 8-byte pointer plus a 28- or 24-byte int/float object.
+
+        numbers = TypedList('q', [3, 1, 2])
+        numbers.append(5); numbers.sort()   # TypedList('q', [1, 2, 3, 5])
+    """
+
+    def __init__(self, typecode='q', iterable=()):
+        self._data = array(typecode, iterable)
+
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    def _wrap(self, data):
+        result = TypedList.__new__(TypedList)
+        result._data = data
+        return result
+
+    # --- The list method surface ---
+
+    def append(self, x):
+        self._data.append(x)
+
+    def extend(self, iterable):
+        if isinstance(iterable, TypedList):
+            iterable = iterable._data
+        if isinstance(iterable, array) and iterable.typecode != self.typecode:
+            iterable = iterable.tolist()  # array.extend only takes arrays of its own type
+        self._data.extend(iterable)
+
+    def insert(self, i, x):
+        self._data.insert(i, x)
+
+    def pop(self, i=-1):
+        return self._data.pop(i)
+
+    def remove(self, x):
+        self._data.remove(x)
+
+    def clear(self):
+        del self._data[:]
+
+    def copy(self):
+        return self._wrap(array(self.typecode, self._data))
+
+    def count(self, x):
+        return self._data.count(x)
+
+    def index(self, x, start=0, stop=sys.maxsize):
+        return self._data.index(x, start, stop)
+
+    def reverse(self):
+        self._data.reverse()
+
+    def sort(self, key=None, reverse=False):
+        # array has no sort(); sorted() works on a temporary list, then the values are
+        # copied back into the same array, so exported memoryviews see the new order
+        self._data[:] = array(self.typecode, sorted(self._data, key=key, reverse=reverse))
+
+    # --- Sequence protocol ---
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._wrap(self._data[index])
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            if isinstance(value, TypedList):
+                value = value._data
+            if not isinstance(value, array) or value.typecode != self.typecode:
+                value = array(self.typecode, value)  # slice assignment needs an array of our type
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, x):
+        return x in self._data
+
+    def __eq__(self, other):
+        if isinstance(other, TypedList):
+            return self._data == other._data
+        if isinstance(other, list):
+            return self._data.tolist() == other
+        return NotImplemented
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __repr__(self):
+        return f"TypedList({self.typecode!r}, {self._data.tolist()})"
+
+    # --- Zero-copy sharing ---
+
+    def memoryview(self):
+        """A view of the raw values, e.g. for file.write(), struct or NumPy.
+
+        No data is copied. While a view exists the list can't change size
+        (array raises BufferError), so release it when you're done.
+        """
+        return memoryview(self._data)
+
+    def __buffer__(self, flags):
+        """Lets memoryview(typed_list) work directly on Python 3.12+."""
+        return memoryview(self._data)
+
+    def tobytes(self):
+        return self._data.tobytes()
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def benchmark(count=1_000_000):
+    values = range(count)
+    print(f"{count:,} ints")
+    for name, make in (("list", list), ("TypedList", lambda: TypedList('q'))):
+        # Memory is measured on its own: tracemalloc slows every allocation down
+        tracemalloc.start()
+        numbers = make()
+        numbers.extend(values)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        def append_all():
+            appended = make()
+            for value in values:
+                appended.append(value)
+
+        extend_time = _timed(lambda: make().extend(values))
+        append_time = _timed(append_all)
+        sum_time = _timed(lambda: sum(numbers))
+        sort_time = _timed(lambda: numbers.sort(reverse=True))
+        print(f"{name:<10} memory {memory / 1e6:>6.1f} MB   append {append_time:.3f} s   "
+              f"extend {extend_time:.3f} s   sum {sum_time:.3f} s   sort {sort_time:.3f} s")
+
+
+if __name__ == "__main__":
+    numbers = TypedList('q', [5, 3, 8])
+    numbers.append(1)
+    numbers.extend([9, 2])
+    numbers.insert(0, 7)
+    print(numbers.pop(), numbers)          # 2 TypedList('q', [7, 5, 3, 8, 1, 9])
+    numbers.sort()
+    print(numbers, numbers.count(3))       # TypedList('q', [1, 3, 5, 7, 8, 9]) 1
+    view = numbers.memoryview()
+    print(view.format, view.nbytes, list(view[:3]))  # q 48 [1, 3, 5]
+    view.release()
+    benchmark()
@@ -0,0 +1,116 @@
+# File: async_log_writer.py
+import asyncio
+import os
+
+from log_writer import current_timestamp
+
+
+class AsyncLogSink:
+    """Lets many coroutines (and threads) log through one writer task.
+
+    Producers put finished entries on a bounded queue. When the queue is
+    full, `await sink.log(...)` waits, which slows producers down instead of
+    letting memory grow. The writer task takes entries off the queue in
+    batches and writes each batch in a worker thread, so the event loop is
+    never blocked by disk I/O.
+
+    If a write fails (disk full, file closed), the writer keeps draining the
+    queue so no producer waits forever, and the next log() or close()
+    raises RuntimeError with the write error as its cause.
+    """
+
+    def __init__(self, file_path, max_queue=10000, batch_size=1000, fsync=False):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self._queue = asyncio.Queue(maxsize=max_queue)
+        self._log_file = None
+        self._writer = None
+        self._loop = None
+        self._error = None  # the exception that stopped the writes, if any
+
+    async def start(self):
+        """Opens the file and starts the writer task."""
+        self._loop = asyncio.get_running_loop()
+        self._log_file = await asyncio.to_thread(open, self.file_path, 'a')
+        self._writer = asyncio.create_task(self._write_entries())
+
+    def _check_writer(self):
+        if self._error is not None:
+            raise RuntimeError(f"writing to {self.file_path} failed") from self._error
+        if self._writer.done():
+            raise RuntimeError("the log sink is closed")
+
+    async def log(self, log_message):
+        """Queues an entry, waiting while the queue is full."""
+        self._check_writer()
+        await self._queue.put(f"[{current_timestamp()}] {log_message}\n")
+
+    def log_threadsafe(self, log_message):
+        """Queues an entry from a thread that isn't running the event loop."""
+        future = asyncio.run_coroutine_threadsafe(self.log(log_message), self._loop)
+        future.result()
+
+    def _write_batch(self, batch):
+        """Runs in a worker thread: one write (and optionally fsync) per batch."""
+        self._log_file.write("".join(batch))
+        self._log_file.flush()
+        if self.fsync:
+            os.fsync(self._log_file.fileno())
+
+    async def _write_entries(self):
+        """The single writer: drains the queue until it sees the None sentinel."""
+        done = False
+        while not done:
+            batch = []
+            entry = await self._queue.get()
+            while True:
+                if entry is None:
+                    done = True
+                    break
+                batch.append(entry)
+                if len(batch) >= self.batch_size or self._queue.empty():
+                    break
+                entry = self._queue.get_nowait()
+            if batch and self._error is None:
+                try:
+                    await asyncio.to_thread(self._write_batch, batch)
+                except Exception as error:
+                    self._error = error  # keep draining; log() and close() report it
+
+    async def close(self):
+        """Writes everything already queued, then stops the writer and closes the file."""
+        if not self._writer.done():
+            await self._queue.put(None)
+            await self._writer
+        try:
+            await asyncio.to_thread(self._log_file.close)
+        except OSError as error:
+            self._error = self._error or error  # close() flushes, which can fail too
+        if self._error is not None:
+            raise RuntimeError(f"writing to {self.file_path} failed") from self._error
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+async def main():
+    async def producer(sink, number):
+        for i in range(100):
+            await sink.log(f"Producer {number} sent message {i}")
+
+    # 1000 producers share one sink; the small queue shows the backpressure
+    async with AsyncLogSink('async_logs.txt', max_queue=500) as sink:
+        await asyncio.gather(*(producer(sink, number) for number in range(1000)))
+
+    with open('async_logs.txt') as log_file:
+        print(f"Wrote {sum(1 for _ in log_file)} entries to async_logs.txt")
+    os.remove('async_logs.txt')
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+# File: log_archive.py
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+from log_parser import timestamp_to_epoch
+from log_reader import iter_logs
+
+# Every block starts with: smallest timestamp, largest timestamp, entry count,
+# and the compressed sizes of the timestamp and message columns.
+BLOCK_HEADER = struct.Struct('<qqIII')
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def to_epoch(timestamp):
+    """'YYYY-mm-dd HH:MM:SS' -> whole seconds (the log times are treated as UTC)."""
+    return timestamp_to_epoch(timestamp)
+
+
+def from_epoch(seconds):
+    """Whole seconds -> 'YYYY-mm-dd HH:MM:SS'."""
+    return time.strftime(TIME_FORMAT, time.gmtime(seconds))
+
+
+def _to_bytes(values):
+    """Array -> little-endian bytes, so archives can move between machines."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _encode_block(entries):
+    """Turns a list of (epoch, message) into one compressed block."""
+    # Timestamp column: the first value, then differences (mostly tiny numbers)
+    deltas = array('q', [entries[0][0]])
+    for (previous, _), (current, _) in zip(entries, entries[1:]):
+        deltas.append(current - previous)
+    time_column = zlib.compress(_to_bytes(deltas))
+
+    # Message column: each distinct message is stored once, rows keep an index
+    dictionary = {}
+    indexes = array('I', (dictionary.setdefault(message, len(dictionary))
+                          for _, message in entries))
+    words = "\n".join(dictionary).encode('utf-8')
+    message_column = zlib.compress(struct.pack('<I', len(words)) + words + _to_bytes(indexes))
+
+    # Min and max, not first and last: local times run backwards when DST ends
+    epochs = [epoch for epoch, _ in entries]
+    header = BLOCK_HEADER.pack(min(epochs), max(epochs), len(entries),
+                               len(time_column), len(message_column))
+    return header + time_column + message_column
+
+
+def write_archive(file_path, archive_path, block_entries=16384):
+    """Streams a log file into a columnar, block-compressed archive.
+
+    Lines without a timestamp are left out, as they can't be range-queried.
+    """
+    block = []
+    with open(archive_path, 'wb') as archive:
+        for _, timestamp, message in iter_logs(file_path):
+            if timestamp is None:
+                continue
+            block.append((to_epoch(timestamp), message))
+            if len(block) == block_entries:
+                archive.write(_encode_block(block))
+                block = []
+        if block:
+            archive.write(_encode_block(block))
+
+
+def _blocks(archive):
+    """Yields (lowest, highest, count, time_column, message_column_offset, message_size)."""
+    while True:
+        header = archive.read(BLOCK_HEADER.size)
+        if not header:
+            return
+        lowest, highest, count, time_size, message_size = BLOCK_HEADER.unpack(header)
+        time_column = archive.read(time_size)
+        message_offset = archive.tell()
+        # Skip the message column; it is only read if the block has matches
+        archive.seek(message_size, os.SEEK_CUR)
+        yield lowest, highest, count, time_column, message_offset, message_size
+
+
+def _decode_times(time_column):
+    """Rebuilds the epoch values from the delta-encoded column."""
+    deltas = _from_bytes('q', zlib.decompress(time_column))
+    times = array('q')
+    total = 0
+    for delta in deltas:
+        total += delta
+        times.append(total)
+    return times
+
+
+def read_timestamps(archive_path):
+    """Yields every timestamp (as epoch seconds) without touching the messages."""
+    with open(archive_path, 'rb') as archive:
+        for _, _, _, time_column, _, _ in _blocks(archive):
+            yield from _decode_times(time_column)
+
+
+def query_archive(archive_path, start, end):
+    """Yields (timestamp, message) for start <= timestamp <= end.
+
+    Blocks outside the range are skipped using only their header, and the
+    message column is decompressed only for blocks that have a match.
+    """
+    start, end = to_epoch(start), to_epoch(end)
+    with open(archive_path, 'rb') as archive:
+        for lowest, highest, count, time_column, message_offset, message_size in _blocks(archive):
+            if highest < start or lowest > end:
+                continue
+            times = _decode_times(time_column)
+            rows = [row for row in range(count) if start <= times[row] <= end]
+            if not rows:
+                continue
+
+            position = archive.tell()
+            archive.seek(message_offset)
+            data = zlib.decompress(archive.read(message_size))
+            archive.seek(position)
+            (words_size,) = struct.unpack_from('<I', data)
+            dictionary = data[4:4 + words_size].decode('utf-8').split("\n")
+            indexes = _from_bytes('I', data[4 + words_size:])
+            for row in rows:
+                yield from_epoch(times[row]), dictionary[indexes[row]]
+
+
+def main():
+    log_file_path = 'logs.txt'
+    archive_path = 'logs_backup.clog'
+
+    write_archive(log_file_path, archive_path)
+    print(f"{log_file_path}: {os.path.getsize(log_file_path)} bytes, "
+          f"{archive_path}: {os.path.getsize(archive_path)} bytes")
+
+    print("Timestamps only:", [from_epoch(seconds) for seconds in read_timestamps(archive_path)])
+    for timestamp, message in query_archive(archive_path, "2024-10-08 12:05:00", "2024-10-08 12:10:59"):
+        print(f"[{timestamp}] {message}")
+    os.remove(archive_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# File: log_backup.py
+import os
+import shutil
+import time
+
+CHUNK_SIZE = 1024 * 1024
+CHECK_SIZE = 4096  # bytes compared at each end of the backup before appending to it
+
+
+def _copy_range(src_file, dst_file, offset, count):
+    """Copies `count` bytes starting at `offset`, inside the kernel when possible."""
+    src_fd, dst_fd = src_file.fileno(), dst_file.fileno()
+    copied = 0
+
+    # copy_file_range (Linux) and sendfile never bring the bytes into Python
+    for name in ('copy_file_range', 'sendfile'):
+        copy = getattr(os, name, None)
+        if copy is None:
+            continue
+        try:
+            while copied < count:
+                if name == 'copy_file_range':
+                    sent = copy(src_fd, dst_fd, min(CHUNK_SIZE, count - copied), offset + copied)
+                else:
+                    sent = copy(dst_fd, src_fd, offset + copied, min(CHUNK_SIZE, count - copied))
+                if sent == 0:
+                    break
+                copied += sent
+            return copied
+        except OSError:
+            # Not supported for these files (e.g. across filesystems), try the next way
+            continue
+
+    # Fallback: plain chunked copy through a buffer
+    src_file.seek(offset + copied)
+    while copied < count:
+        chunk = src_file.read(min(CHUNK_SIZE, count - copied))
+        if not chunk:
+            break
+        view = memoryview(chunk)
+        while view:
+            view = view[dst_file.write(view):]
+        copied += len(chunk)
+    return copied
+
+
+def _continues_backup(file_path, backup_path, size):
+    """True if the log still starts with the backup's first `size` bytes.
+
+    Only the first and last CHECK_SIZE bytes of that range are compared,
+    which is enough to tell an appended log from a rotated one.
+    """
+    with open(file_path, 'rb') as src_file, open(backup_path, 'rb') as backup_file:
+        for offset in {0, max(size - CHECK_SIZE, 0)}:
+            src_file.seek(offset)
+            backup_file.seek(offset)
+            length = min(CHECK_SIZE, size - offset)
+            if src_file.read(length) != backup_file.read(length):
+                return False
+    return True
+
+
+def backup_logs(file_path, backup_path, incremental=False):
+    """Copies the log file to the backup without decoding it.
+
+    With `incremental=True` only the bytes written since the last backup are
+    appended. If the log no longer starts with what the backup holds (it
+    was rotated, even if it has grown past the old size since), a full
+    copy is made instead. Returns (bytes_copied, bytes_per_second).
+    """
+    start = time.perf_counter()
+    source_size = os.path.getsize(file_path)
+    offset = 0
+    if incremental and os.path.exists(backup_path):
+        offset = os.path.getsize(backup_path)
+        if offset > source_size or not _continues_backup(file_path, backup_path, offset):
+            offset = 0
+
+    # Unbuffered, and not 'ab': copy_file_range refuses files opened with O_APPEND
+    mode = 'r+b' if offset else 'wb'
+    with open(file_path, 'rb') as src_file, open(backup_path, mode, buffering=0) as dst_file:
+        dst_file.seek(offset)
+        copied = _copy_range(src_file, dst_file, offset, source_size - offset)
+
+    elapsed = time.perf_counter() - start
+    rate = copied / elapsed if elapsed > 0 else 0.0
+    return copied, rate
+
+
+def main():
+    log_file_path = 'logs.txt'
+    backup_file_path = 'logs_backup.txt'
+
+    copied, rate = backup_logs(log_file_path, backup_file_path)
+    print(f"Full backup: {copied} bytes at {rate / 1e6:.1f} MB/s")
+
+    # Nothing new was logged, so the incremental run copies 0 bytes
+    copied, rate = backup_logs(log_file_path, backup_file_path, incremental=True)
+    print(f"Incremental backup: {copied} bytes at {rate / 1e6:.1f} MB/s")
+
+    # For comparison, the buffered copy from the standard library
+    start = time.perf_counter()
+    shutil.copyfile(log_file_path, backup_file_path)
+    print(f"shutil.copyfile took {time.perf_counter() - start:.6f} s")
+
+
+if __name__ == "__main__":
+    main()
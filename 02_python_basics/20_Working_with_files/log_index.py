@@ -0,0 +1,136 @@
+# File: log_index.py
+import bisect
+import mmap
+import os
+
+from log_reader import parse_log_line
+
+
+class LogIndex:
+    """A sparse (timestamp -> byte offset) index stored next to a log file.
+
+    Only one entry is kept every `spacing` bytes, so the index stays tiny.
+    A range query binary-searches the index and then scans just the part
+    of the memory-mapped log that can contain matching entries. Entries are
+    assumed to be appended in time order, as append_log() does.
+    """
+
+    def __init__(self, file_path, spacing=4096):
+        self.file_path = file_path
+        self.index_path = file_path + '.idx'
+        self.spacing = spacing
+        self.timestamps = []
+        self.offsets = []
+        self._load()
+
+    def _load(self):
+        """Reads the sidecar index file, if there is one."""
+        try:
+            with open(self.index_path, 'r') as index_file:
+                for line in index_file:
+                    timestamp, offset = line.rstrip("\n").split("\t")
+                    self.timestamps.append(timestamp)
+                    self.offsets.append(int(offset))
+        except FileNotFoundError:
+            pass
+
+    def _lines(self, log_map, position, end=None):
+        """Yields (offset, line) from the memory map, starting at `position`."""
+        end = len(log_map) if end is None else end
+        while position < end:
+            newline = log_map.find(b"\n", position, len(log_map))
+            if newline == -1:
+                # A line still being written has no newline yet; skip it
+                return
+            yield position, log_map[position:newline]
+            position = newline + 1
+
+    def _still_matches(self, log_map):
+        """True if the log still holds the indexed entries at the first and last offset.
+
+        A log that was rotated and has grown past the old size again would
+        otherwise keep an index full of another file's timestamps.
+        """
+        for timestamp, offset in ((self.timestamps[0], self.offsets[0]),
+                                  (self.timestamps[-1], self.offsets[-1])):
+            if offset >= len(log_map) or (offset and log_map[offset - 1:offset] != b"\n"):
+                return False
+            raw = next(self._lines(log_map, offset), (None, b""))[1]
+            if parse_log_line(raw.decode('utf-8', errors='replace'))[0] != timestamp:
+                return False
+        return True
+
+    def _reset(self):
+        self.timestamps, self.offsets = [], []
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+
+    def update(self):
+        """Indexes the entries appended since the last update.
+
+        If the log was rotated or truncated, the index is rebuilt from scratch.
+        """
+        if os.path.getsize(self.file_path) == 0:
+            if self.offsets:
+                self._reset()
+            return
+
+        new_entries = []
+        with open(self.file_path, 'rb') as log_file, \
+                mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            if self.offsets and not self._still_matches(log_map):
+                self._reset()
+
+            # Rescan from the last indexed entry, which is at most `spacing` bytes back
+            start = self.offsets[-1] if self.offsets else 0
+            next_offset = start + self.spacing if self.offsets else 0
+            for offset, raw in self._lines(log_map, start):
+                if offset < next_offset:
+                    continue
+                timestamp, _ = parse_log_line(raw.decode('utf-8', errors='replace'))
+                if timestamp is None:
+                    continue
+                new_entries.append((timestamp, offset))
+                next_offset = offset + self.spacing
+
+        with open(self.index_path, 'a') as index_file:
+            for timestamp, offset in new_entries:
+                index_file.write(f"{timestamp}\t{offset}\n")
+                self.timestamps.append(timestamp)
+                self.offsets.append(offset)
+
+    def query(self, start, end):
+        """Yields (timestamp, message) for entries with start <= timestamp <= end.
+
+        Timestamps are 'YYYY-mm-dd HH:MM:SS' strings, which sort the same way
+        as the times they stand for.
+        """
+        self.update()
+        if not self.offsets:
+            return
+        # The last indexed entry before `start` is a safe place to begin scanning
+        position = bisect.bisect_left(self.timestamps, start)
+        scan_from = self.offsets[max(position - 1, 0)]
+        with open(self.file_path, 'rb') as log_file, \
+                mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            for _, raw in self._lines(log_map, scan_from):
+                timestamp, message = parse_log_line(raw.decode('utf-8', errors='replace'))
+                if timestamp is None or timestamp < start:
+                    continue
+                if timestamp > end:
+                    break
+                yield timestamp, message
+
+
+def main():
+    index = LogIndex('logs.txt', spacing=64)
+    index.update()
+    print(f"Index has {len(index.offsets)} entries: {list(zip(index.timestamps, index.offsets))}")
+
+    print("Entries between 12:05 and 12:10:59")
+    for timestamp, message in index.query("2024-10-08 12:05:00", "2024-10-08 12:10:59"):
+        print(f"[{timestamp}] {message}")
+
+
+if __name__ == "__main__":
+    main()
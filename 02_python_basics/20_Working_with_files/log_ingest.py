@@ -0,0 +1,76 @@
+# File: log_ingest.py
+import heapq
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from log_reader import iter_logs
+
+
+def make_shards(file_paths, chunk_size=8 * 1024 * 1024):
+    """Splits the files into (file_path, start, end) byte ranges of about `chunk_size`.
+
+    The ranges don't need to line up with newlines: iter_logs() gives every
+    line to the range it starts in, so no line is lost or read twice.
+    """
+    shards = []
+    for file_path in file_paths:
+        size = os.path.getsize(file_path)
+        for start in range(0, max(size, 1), chunk_size):
+            shards.append((file_path, start, min(start + chunk_size, size)))
+    return shards
+
+
+def parse_shard(shard):
+    """Parses one byte range and returns its (timestamp, message) entries sorted by time."""
+    file_path, start, end = shard
+    entries = [(timestamp, message)
+               for _, timestamp, message in iter_logs(file_path, start, end)
+               if timestamp is not None]
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def ingest_logs(file_paths, workers=None, chunk_size=8 * 1024 * 1024):
+    """Parses many log files in parallel and yields their entries in timestamp order."""
+    shards = make_shards(file_paths, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(parse_shard, shards))
+    # Each shard is already sorted, so a k-way merge is enough
+    return heapq.merge(*results, key=lambda entry: entry[0])
+
+
+def benchmark(file_count=8, lines_per_file=200000):
+    """Prints how ingestion time scales from 1 to N worker processes."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for number in range(file_count):
+            file_path = os.path.join(tmp_dir, f'logs.{number}.txt')
+            with open(file_path, 'w') as log_file:
+                for i in range(lines_per_file):
+                    seconds = i * file_count + number
+                    log_file.write(f"[2024-10-08 {seconds // 3600 % 24:02d}:{seconds // 60 % 60:02d}:"
+                                   f"{seconds % 60:02d}] host {number} event {i}\n")
+            file_paths.append(file_path)
+
+        print(f"{'workers':>8} {'seconds':>10} {'speed-up':>9}")
+        baseline = None
+        for workers in range(1, (os.cpu_count() or 1) + 1):
+            start = time.perf_counter()
+            count = sum(1 for _ in ingest_logs(file_paths, workers, chunk_size=1024 * 1024))
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>10.2f} {baseline / elapsed:>8.1f}x")
+        print(f"({count} entries from {file_count} files)")
+
+
+def main():
+    file_paths = sys.argv[1:] or ['logs.txt']
+    for timestamp, message in ingest_logs(file_paths):
+        print(f"[{timestamp}] {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# File: log_parser.py
+import calendar
+import os
+import re
+import tempfile
+import time
+from datetime import datetime
+
+# Midnight of each date seen so far, so strptime runs once per day, not once per line
+_day_epochs = {}
+# Start of each b'YYYY-mm-dd HH:MM' seen recently; log lines mostly share their minute
+_minute_epochs = {}
+MAX_CACHED_MINUTES = 65536
+
+LOG_LINE = re.compile(rb'\[(\d{4}-\d\d-\d\d) (\d\d):(\d\d):(\d\d)\] (.*)')
+
+
+def _day_epoch(date):
+    """'YYYY-mm-dd' (str or bytes) -> epoch seconds at midnight UTC, cached per date."""
+    epoch = _day_epochs.get(date)
+    if epoch is None:
+        text = date.decode('ascii') if isinstance(date, bytes) else date
+        epoch = calendar.timegm(time.strptime(text, "%Y-%m-%d"))
+        _day_epochs[date] = epoch
+    return epoch
+
+
+def timestamp_to_epoch(timestamp):
+    """'YYYY-mm-dd HH:MM:SS' -> epoch seconds (the log times are treated as UTC)."""
+    return (_day_epoch(timestamp[:10]) + int(timestamp[11:13]) * 3600
+            + int(timestamp[14:16]) * 60 + int(timestamp[17:19]))
+
+
+def _minute_epoch(minute):
+    """b'YYYY-mm-dd HH:MM' -> epoch seconds, remembered for the next lines."""
+    if len(_minute_epochs) >= MAX_CACHED_MINUTES:
+        _minute_epochs.clear()
+    epoch = _day_epoch(minute[:10]) + int(minute[11:13]) * 3600 + int(minute[14:16]) * 60
+    _minute_epochs[minute] = epoch
+    return epoch
+
+
+def parse_line(line):
+    """b'[YYYY-mm-dd HH:MM:SS] message\\n' -> (epoch, message), or None if it isn't an entry.
+
+    The timestamp has a fixed width, so its parts are sliced out by position,
+    and only the seconds are converted for a minute that was seen before.
+    """
+    if line[:1] != b'[' or line[20:22] != b'] ':
+        return None
+    minute = line[1:17]
+    try:
+        epoch = _minute_epochs.get(minute)
+        if epoch is None:
+            epoch = _minute_epoch(minute)
+        epoch += int(line[18:20])
+    except ValueError:
+        return None
+    return epoch, line[22:].rstrip(b'\r\n').decode('utf-8', errors='replace')
+
+
+def iter_parsed(file_path):
+    """Yields (epoch, message) for every entry in the file, reading bytes in 1 MB chunks."""
+    with open(file_path, 'rb', buffering=1024 * 1024) as log_file:
+        for line in log_file:
+            entry = parse_line(line)
+            if entry is not None:
+                yield entry
+
+
+def _parse_strptime(line):
+    """The straightforward way, for comparison: decode, split, strptime."""
+    text = line.decode('utf-8')
+    timestamp, message = text[1:20], text[22:].rstrip('\r\n')
+    return int(datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").timestamp()), message
+
+
+def _parse_regex(line):
+    match = LOG_LINE.match(line)
+    if match is None:
+        return None
+    date, hours, minutes, seconds, message = match.groups()
+    return (_day_epoch(date) + int(hours) * 3600 + int(minutes) * 60 + int(seconds),
+            message.rstrip(b'\r').decode('utf-8', errors='replace'))
+
+
+def benchmark(line_count=10_000_000):
+    """Prints lines/sec of each parsing approach on a generated log file."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'big_logs.txt')
+        with open(file_path, 'w') as log_file:
+            for i in range(line_count):
+                seconds = i // 10
+                log_file.write(f"[2024-10-{8 + seconds // 86400:02d} {seconds // 3600 % 24:02d}:"
+                               f"{seconds // 60 % 60:02d}:{seconds % 60:02d}] User event {i}\n")
+
+        for name, parse in (("strptime", _parse_strptime), ("regex", _parse_regex),
+                            ("fixed offsets", parse_line)):
+            start = time.perf_counter()
+            with open(file_path, 'rb', buffering=1024 * 1024) as log_file:
+                for line in log_file:
+                    parse(line)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<14} {line_count / elapsed:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    for epoch, message in iter_parsed('logs.txt'):
+        print(epoch, message)
+    benchmark()
@@ -0,0 +1,84 @@
+# File: log_reader.py
+import os
+
+
+def parse_log_line(line):
+    """Splits a '[YYYY-mm-dd HH:MM:SS] message' line into (timestamp, message)."""
+    line = line.rstrip("\r\n")
+    if line.startswith("[") and line[20:22] == "] ":
+        return line[1:20], line[22:]
+    # Lines that don't follow the format are kept, just without a timestamp
+    return None, line
+
+
+def iter_logs(file_path, start=0, end=None):
+    """Yields (next_offset, timestamp, message) for each entry, one line at a time.
+
+    Only one line is held in memory at once. `start` and `end` are byte
+    offsets: a line belongs to the range if it *starts* inside it.
+    `next_offset` is where the entry's line ends, so a job can save the
+    last one it saw and resume with start=next_offset without seeing that
+    entry again.
+    """
+    with open(file_path, 'rb') as log_file:
+        offset = start
+        if start > 0:
+            # Step back one byte so a start that lands exactly on a line
+            # boundary keeps that line, then skip the partial line.
+            log_file.seek(start - 1)
+            offset = start - 1 + len(log_file.readline())
+        while end is None or offset < end:
+            raw = log_file.readline()
+            if not raw:
+                break
+            offset += len(raw)
+            if raw.strip():  # blank lines are not entries
+                timestamp, message = parse_log_line(raw.decode('utf-8', errors='replace'))
+                yield offset, timestamp, message
+
+
+def tail_logs(file_path, count=10, block_size=4096):
+    """Yields the last `count` entries by reading the file backwards in blocks."""
+    if count <= 0:
+        return
+    with open(file_path, 'rb') as log_file:
+        position = log_file.seek(0, os.SEEK_END)
+        data = b""
+        lines = []
+        # Keep one extra line, since the first one may be cut in half
+        while position > 0 and len(lines) <= count:
+            step = min(block_size, position)
+            position -= step
+            log_file.seek(position)
+            data = log_file.read(step) + data
+            lines = [line for line in data.splitlines() if line.strip()]
+    if position > 0 and not data.startswith(b"\n"):
+        lines = lines[1:]
+    for line in lines[-count:]:
+        yield parse_log_line(line.decode('utf-8', errors='replace'))
+
+
+def main():
+    log_file_path = 'logs.txt'
+
+    # Stream entries without loading the whole file; this job stops after two
+    last_offset = 0
+    for count, (offset, timestamp, message) in enumerate(iter_logs(log_file_path), start=1):
+        print(f"{offset:>6}  {timestamp}  {message}")
+        last_offset = offset
+        if count == 2:
+            break
+
+    # Resume from the saved offset (e.g. where the last rotation job stopped)
+    print("\nResuming from offset", last_offset)
+    for offset, timestamp, message in iter_logs(log_file_path, start=last_offset):
+        print(f"{offset:>6}  {timestamp}  {message}")
+
+    # Only the newest entries, read from the end of the file
+    print("\nLast 2 entries:")
+    for timestamp, message in tail_logs(log_file_path, count=2):
+        print(f"[{timestamp}] {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# File: log_writer.py
+import contextlib
+import os
+import tempfile
+import threading
+import time
+import weakref
+from datetime import datetime
+
+from main import append_log
+
+_cached_second = None
+_cached_timestamp = None
+
+
+def current_timestamp():
+    """Formats the current time once per second instead of once per entry."""
+    global _cached_second, _cached_timestamp
+    second = int(time.time())
+    if second != _cached_second:
+        _cached_timestamp = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        _cached_second = second
+    return _cached_timestamp
+
+
+class BufferedLogger:
+    """Keeps the log file open and writes entries in batches.
+
+    A background thread flushes the buffer once `flush_interval` seconds
+    have passed, even if no more entries arrive. If the logger is never
+    closed, whatever is buffered is still written when it is garbage
+    collected or when the interpreter exits. With flush_interval <= 0 every
+    entry is flushed inside log() and no thread is started.
+    """
+
+    def __init__(self, file_path, buffer_size=64 * 1024, flush_interval=1.0, fsync=False):
+        self.file_path = file_path
+        self.buffer_size = buffer_size        # flush once this many characters are waiting
+        self.flush_interval = flush_interval  # ...or once this many seconds have passed
+        self.fsync = fsync                    # also force the data to disk on every flush
+        self._log_file = open(file_path, 'a')
+        self._buffer = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()  # the flusher thread shares the buffer
+
+        # The thread only holds a weak reference, so an unclosed logger can still be collected
+        stop = threading.Event()
+        flusher = None
+        if flush_interval > 0:  # a zero wait would make the thread spin
+            flusher = threading.Thread(target=_flush_periodically,
+                                       args=(weakref.ref(self), stop, flush_interval),
+                                       name=f"BufferedLogger({file_path})", daemon=True)
+        self._finalizer = weakref.finalize(self, _close_log, self._log_file, self._buffer,
+                                           self._lock, stop, flusher)
+        if flusher is not None:
+            flusher.start()
+
+    def log(self, log_message):
+        """Adds an entry to the buffer, flushing it if a threshold is reached."""
+        entry = f"[{current_timestamp()}] {log_message}\n"
+        with self._lock:
+            self._buffer.append(entry)
+            self._buffered += len(entry)
+            if (self._buffered >= self.buffer_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+
+    def flush(self):
+        """Writes every buffered entry to the file in a single call."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._log_file.closed:
+            return
+        if self._buffer:
+            self._log_file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self._log_file.flush()
+        if self.fsync:
+            os.fsync(self._log_file.fileno())
+        self._last_flush = time.monotonic()
+
+    def _flush_if_due(self):
+        with self._lock:
+            if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def close(self):
+        """Flushes what is left, stops the flusher thread and closes the file."""
+        self.flush()
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _flush_periodically(logger_ref, stop, interval):
+    """Flusher thread: wakes up every `interval` seconds and flushes an idle buffer."""
+    while not stop.wait(interval):
+        logger = logger_ref()
+        if logger is None:
+            return
+        logger._flush_if_due()
+        del logger  # don't keep the logger alive while waiting
+
+
+def _close_log(log_file, buffer, lock, stop, flusher):
+    """Runs on close(), garbage collection or interpreter exit, whichever comes first."""
+    stop.set()
+    if flusher is not None and flusher is not threading.current_thread():
+        flusher.join()
+    with lock:
+        if not log_file.closed:
+            log_file.write("".join(buffer))
+            buffer.clear()
+            log_file.close()
+
+
+def benchmark(count=20000):
+    """Compares entries/sec of append_log() against BufferedLogger."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench_logs.txt')
+
+        # append_log() prints every entry, so hide that output while timing
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            for i in range(count):
+                append_log(path, f"Event number {i}")
+            per_call = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with BufferedLogger(path) as logger:
+            for i in range(count):
+                logger.log(f"Event number {i}")
+        buffered = time.perf_counter() - start
+
+    print(f"append_log():   {count / per_call:>12,.0f} entries/sec")
+    print(f"BufferedLogger: {count / buffered:>12,.0f} entries/sec")
+    print(f"Speed-up:       {per_call / buffered:>12.1f}x")
+
+
+def main():
+    with BufferedLogger('logs.txt') as logger:
+        logger.log("User logged in")
+        logger.log("User updated settings")
+
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# Finds every place a built-in name (open, list, id, ...) is shadowed, like `open` in main.py
+#
+# Usage: python shadow_scanner.py [SOURCE_DIR] [CACHE_FILE]
+import ast
+import builtins
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+BUILTIN_NAMES = {name for name in dir(builtins) if not name.startswith('_')}
+# Part of every cache key, so cached findings are dropped when the rules change
+SCANNER_VERSION = b'3'
+
+
+class ShadowFinder(ast.NodeVisitor):
+    """Collects (line, column, name, kind) for each binding of a built-in name.
+
+    Names bound directly in a class body (methods, class attributes) get
+    the kind 'class attribute': they hide the built-in for the rest of the
+    class body, but not inside its methods, which still see the built-in.
+    """
+
+    def __init__(self):
+        self.found = []
+        self._in_class_body = False
+
+    def _check(self, node, name, kind):
+        if name in BUILTIN_NAMES:
+            if self._in_class_body:
+                kind = 'class attribute'
+            self.found.append((node.lineno, node.col_offset, name, kind))
+
+    def _visit_scope(self, node, in_class_body):
+        outer, self._in_class_body = self._in_class_body, in_class_body
+        self.generic_visit(node)
+        self._in_class_body = outer
+
+    def visit_Name(self, node):
+        # `del open` removes a binding, it doesn't create one
+        if isinstance(node.ctx, ast.Store):
+            self._check(node, node.id, 'assignment')
+
+    def visit_arg(self, node):
+        self._check(node, node.arg, 'argument')
+
+    def visit_FunctionDef(self, node):
+        self._check(node, node.name, 'function')
+        self._visit_scope(node, in_class_body=False)
+
+    def visit_AsyncFunctionDef(self, node):
+        self.visit_FunctionDef(node)
+
+    def visit_Lambda(self, node):
+        self._visit_scope(node, in_class_body=False)
+
+    def _visit_comprehension(self, node):
+        # Loop variables of a comprehension live in its own scope
+        self._visit_scope(node, in_class_body=False)
+
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = _visit_comprehension
+
+    def visit_ClassDef(self, node):
+        self._check(node, node.name, 'class')
+        self._visit_scope(node, in_class_body=True)
+
+    def visit_alias(self, node):
+        # `import x.y` binds `x`; `import a as b` and `from m import b` bind `b`
+        name = node.asname or node.name.split('.')[0]
+        self._check(node, name, 'import')
+
+    # Match captures are plain strings on the pattern node, not Name nodes
+    def visit_MatchAs(self, node):
+        if node.name:
+            self._check(node, node.name, 'match capture')
+        self.generic_visit(node)
+
+    def visit_MatchStar(self, node):
+        if node.name:
+            self._check(node, node.name, 'match capture')
+
+    def visit_MatchMapping(self, node):
+        if node.rest:
+            self._check(node, node.rest, 'match capture')
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            self._check(node, node.name, 'except')
+        self.generic_visit(node)
+
+    def visit_Global(self, node):
+        for name in node.names:
+            self._check(node, name, 'global')
+
+
+def scan_source(source, file_name='<source>'):
+    """Returns the shadowed built-ins in a piece of source code, sorted by position."""
+    finder = ShadowFinder()
+    finder.visit(ast.parse(source, file_name))
+    return sorted(finder.found)
+
+
+def _scan_file(job):
+    """Worker: (path, digest, source bytes) -> (path, digest, findings or error text)."""
+    path, digest, source = job
+    try:
+        return path, digest, scan_source(source, path)
+    except (SyntaxError, ValueError) as error:
+        return path, digest, f"could not parse: {error}"
+
+
+def _python_files(source_dir):
+    for folder, sub_folders, files in os.walk(source_dir):
+        sub_folders[:] = [name for name in sub_folders
+                          if name not in ('__pycache__', '.git') and not name.startswith('.')]
+        for name in sorted(files):
+            if name.endswith('.py'):
+                yield os.path.join(folder, name)
+
+
+def scan_tree(source_dir, cache_path=None, workers=None):
+    """Scans every .py file under source_dir and returns ({path: findings}, parsed_count).
+
+    parsed_count is how many files were parsed rather than taken from the cache.
+
+    Files are identified by a hash of their content, so with a cache file
+    only new or changed files are parsed again; those are parsed in
+    parallel by a process pool.
+    """
+    cache = {}
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path) as cache_file:
+            cache = json.load(cache_file)
+
+    results, jobs = {}, []
+    for path in _python_files(source_dir):
+        with open(path, 'rb') as source_file:
+            source = source_file.read()
+        digest = hashlib.sha256(SCANNER_VERSION + source).hexdigest()
+        cached = cache.get(path)
+        if cached and cached['hash'] == digest:
+            results[path] = cached['findings']
+        else:
+            jobs.append((path, digest, source))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for path, digest, findings in executor.map(_scan_file, jobs, chunksize=16):
+                results[path] = findings
+                cache[path] = {'hash': digest, 'findings': findings}
+
+    if cache_path:
+        # Forget files that no longer exist
+        cache = {path: entry for path, entry in cache.items() if path in results}
+        with open(cache_path, 'w') as cache_file:
+            json.dump(cache, cache_file)
+    return results, len(jobs)
+
+
+def main():
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else '.'
+    cache_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(source_dir, '.shadow_cache.json')
+
+    results, parsed = scan_tree(source_dir, cache_path)
+    for path, findings in sorted(results.items()):
+        if isinstance(findings, str):
+            print(f"{path}: {findings}")
+            continue
+        for line, column, name, kind in findings:
+            print(f"{path}:{line}:{column + 1}: built-in '{name}' shadowed ({kind})")
+    print(f"{len(results)} files checked, {parsed} parsed, {len(results) - parsed} from cache",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# File: attr_cache.py
+import time
+import types
+import weakref
+
+
+class WatchedModule(types.ModuleType):
+    """A module that tells its call sites when one of its attributes is rebound."""
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        for site in self.__dict__['__call_sites__'].get(name, ()):
+            site.refresh()
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        for site in self.__dict__['__call_sites__'].get(name, ()):
+            site.refresh()
+
+
+def watch(module):
+    """Turns a module into a WatchedModule (a module's class may be swapped in place)."""
+    if not isinstance(module, WatchedModule):
+        module.__dict__.setdefault('__call_sites__', {})
+        module.__class__ = WatchedModule
+    return module
+
+
+class CallSite:
+    """Holds the resolved `module.name` so a hot loop skips the dotted lookup.
+
+    `site.target` is kept up to date when code does `module.name = ...` or
+    `del module.name`. Code inside the module that rebinds its own global
+    with a `global` statement writes to the module dict directly; call
+    `refresh()` after that.
+
+    The module only keeps weak references to its call sites, so a site
+    created inside a function goes away with that function's frame.
+    """
+
+    __slots__ = ('module', 'name', 'target', '__weakref__')
+
+    def __init__(self, module, name):
+        self.module = watch(module)
+        self.name = name
+        self.target = getattr(module, name)
+        module.__dict__['__call_sites__'].setdefault(name, weakref.WeakSet()).add(self)
+
+    def refresh(self):
+        try:
+            self.target = getattr(self.module, self.name)
+        except AttributeError:
+            self.target = _missing(self.module.__name__, self.name)
+
+    def __call__(self, *args, **kwargs):
+        return self.target(*args, **kwargs)
+
+
+def _missing(module_name, name):
+    """Stands in for a deleted attribute, so calling the site raises AttributeError."""
+    def target(*args, **kwargs):
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+    return target
+
+
+_hot = None  # the module used by the benchmark, looked up as a global like `b` in main.py
+
+
+def _dotted_loop(count):
+    for i in range(count):
+        _hot.work(i)             # global lookup of `_hot`, then attribute lookup of `work`
+
+
+def _call_site_loop(site, count):
+    for i in range(count):
+        site.target(i)           # one slot read, still sees rebinding between iterations
+
+
+def _local_loop(site, count):
+    target = site.target
+    for i in range(count):
+        target(i)                # a local: no lookups at all
+
+
+def benchmark(count=5_000_000):
+    """Times calling a module function through a dotted name, a CallSite and a local."""
+    global _hot
+    _hot = types.ModuleType('hot')
+    exec("def work(x):\n    return x", _hot.__dict__)
+    site = CallSite(_hot, 'work')
+
+    timings = []
+    for loop, args in ((_dotted_loop, (count,)), (_call_site_loop, (site, count)),
+                       (_local_loop, (site, count))):
+        start = time.perf_counter()
+        loop(*args)
+        timings.append(time.perf_counter() - start)
+
+    _hot.work = lambda x: -x     # rebinding is picked up by the call site
+    assert site.target(1) == -1
+
+    dotted, slot, local = timings
+    print(f"_hot.work(i):     {dotted:.3f} s")
+    print(f"site.target(i):   {slot:.3f} s  ({dotted / slot:.2f}x)")
+    print(f"local target(i):  {local:.3f} s  ({dotted / local:.2f}x)")
+
+
+if __name__ == "__main__":
+    import b
+
+    spam = CallSite(b, 'spam')
+    spam("Muhammad Hashim")     # same as b.spam("Muhammad Hashim")
+    b.spam = lambda text: print(f"{text} eggs")
+    spam("Muhammad Hashim")     # sees the new function: "Muhammad Hashim eggs"
+    benchmark()
@@ -1,5 +1,5 @@
 # File: b.py
-import c
+# c is imported inside spam(), so c.py only runs the first time spam() is called
 
 
 version = "1.0"
@@ -9,4 +9,5 @@ def spam(text):
 
     
 def spam(text):
+    import c  # after the first call this is just a lookup in sys.modules
     c.ham(text)
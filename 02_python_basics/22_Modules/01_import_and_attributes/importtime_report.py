@@ -0,0 +1,48 @@
+# File: importtime_report.py
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXAMPLE_MODULES = {'main', 'b', 'c', 'lazy', 'importlib.util'}
+
+
+def import_times(code="import b"):
+    """Runs `python -X importtime -c code` here and returns its (module, self_us, cumulative_us) rows."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=HERE, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:       123 |        456 |   module"
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def report(code="import b"):
+    """Prints the import cost of the example modules and of everything else."""
+    rows = import_times(code)
+    print(f"Import times for: {code}")
+    print(f"{'module':<16} {'self (us)':>10} {'cumulative (us)':>16}")
+    other = 0
+    for module, self_us, cumulative_us in rows:
+        if module in EXAMPLE_MODULES:
+            print(f"{module:<16} {self_us:>10} {cumulative_us:>16}")
+        else:
+            other += self_us
+    print(f"{'(others)':<16} {other:>10}")
+    print()
+
+
+if __name__ == "__main__":
+    # What b.py used to pay up front by running `import c`
+    report("import c")
+    # spam() imports c itself, so c.py is not executed during `import b`
+    report("import b")
+    # The LazyLoader way also postpones c.py, but pays for importlib.util
+    # up front: only worth it when the module itself is expensive
+    report("from lazy import lazy_import; c = lazy_import('c')")
@@ -0,0 +1,25 @@
+# File: lazy.py
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Returns a module that is only executed when one of its attributes is first used.
+
+    The module is found right away (so a typo still fails at import time),
+    but running its code is postponed by importlib.util.LazyLoader.
+    Importing importlib.util costs a few milliseconds itself, so this only
+    pays off for modules that are expensive to run; for a small module, an
+    `import` inside the function that uses it (see b.py) is cheaper.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,102 @@
+# File: import_benchmark.py
+#
+# Measures what the __pycache__ bytecode cache saves when importing
+# my_module.py, b.py and c.py. Every import runs in a fresh interpreter.
+#
+# Usage: python import_benchmark.py [results.csv]
+# With a file name, results are appended to it so runs can be compared.
+import compileall
+import csv
+import os
+import py_compile
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMPORTS_DIR = os.path.join(HERE, '..', '01_import_and_attributes')
+SOURCES = [
+    os.path.join(HERE, 'my_module.py'),
+    os.path.join(IMPORTS_DIR, 'b.py'),
+    os.path.join(IMPORTS_DIR, 'c.py'),
+]
+MODULES = ['my_module', 'b', 'c']
+
+# Times only the import statement itself, not interpreter start-up
+TIMER = "import time; t = time.perf_counter(); import {0}; print(time.perf_counter() - t)"
+
+
+def time_import(work_dir, module, no_write=False, repeat=7):
+    """Median time (ms) of importing `module` in `repeat` fresh interpreters."""
+    command = [sys.executable] + (['-B'] if no_write else []) + ['-c', TIMER.format(module)]
+    # Settings from the environment would change where (or whether) .pyc files are written
+    env = {name: value for name, value in os.environ.items()
+           if name not in ('PYTHONDONTWRITEBYTECODE', 'PYTHONPYCACHEPREFIX')}
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(command, cwd=work_dir, env=env, capture_output=True, text=True, check=True)
+        samples.append(float(output.stdout.split()[-1]) * 1000)
+    return statistics.median(samples)
+
+
+def prepare(work_dir, scenario):
+    """Puts __pycache__ into the state the scenario needs."""
+    shutil.rmtree(os.path.join(work_dir, '__pycache__'), ignore_errors=True)
+    modes = {
+        'compileall (timestamp)': py_compile.PycInvalidationMode.TIMESTAMP,
+        'compileall (checked hash)': py_compile.PycInvalidationMode.CHECKED_HASH,
+        'compileall (unchecked hash)': py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    }
+    if scenario in modes:
+        compileall.compile_dir(work_dir, quiet=1, invalidation_mode=modes[scenario])
+
+
+def run_benchmark():
+    """Returns {scenario: {module: milliseconds}}."""
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Work on copies so the repository's own __pycache__ isn't touched
+        for source in SOURCES:
+            shutil.copy(source, work_dir)
+
+        for scenario in ('cold', 'warm', 'compileall (timestamp)',
+                         'compileall (checked hash)', 'compileall (unchecked hash)'):
+            results[scenario] = {}
+            for module in MODULES:
+                prepare(work_dir, scenario)
+                if scenario == 'warm':
+                    # The first import writes the .pyc files, the timed ones reuse them
+                    time_import(work_dir, module, repeat=1)
+                # -B keeps "cold" cold: nothing is written, so every run compiles
+                results[scenario][module] = time_import(work_dir, module, no_write=(scenario == 'cold'))
+    return results
+
+
+def print_table(results):
+    print(f"{'scenario':<28}" + "".join(f"{module + ' (ms)':>16}" for module in MODULES))
+    for scenario, timings in results.items():
+        print(f"{scenario:<28}" + "".join(f"{timings[module]:>16.3f}" for module in MODULES))
+
+
+def save(results, file_path):
+    """Appends one row per scenario and module, tagged with the date and Python version."""
+    new_file = not os.path.exists(file_path)
+    run = time.strftime("%Y-%m-%d %H:%M:%S")
+    version = sys.version.split()[0]
+    with open(file_path, 'a', newline='') as results_file:
+        writer = csv.writer(results_file)
+        if new_file:
+            writer.writerow(['run', 'python', 'scenario', 'module', 'ms'])
+        for scenario, timings in results.items():
+            for module, milliseconds in timings.items():
+                writer.writerow([run, version, scenario, module, f"{milliseconds:.3f}"])
+
+
+if __name__ == "__main__":
+    results = run_benchmark()
+    print_table(results)
+    if len(sys.argv) > 1:
+        save(results, sys.argv[1])